@@ -1,269 +1,471 @@
-import streamlit as st
-import pandas as pd
-
-# Initialize session state for inventory if it doesn't exist
-if 'stationery_inventory' not in st.session_state:
-    st.session_state.stationery_inventory = {}
-
-# Predefined categories
-CATEGORIES = [
-    "Writing Instruments",
-    "Paper Products",
-    "Correction Tools",
-    "Geometry Tools",
-    "Files & Folders",
-    "Office Supplies",
-    "Art & Craft",
-    "School Essentials"
-]
-
-def add_item():
-    st.subheader("Add New Stationery Item")
-    with st.form("add_form"):
-        col1, col2 = st.columns(2)
-        with col1:
-            name = st.text_input("Item Name").strip().title()
-            category = st.selectbox("Category", CATEGORIES)
-            publisher = st.text_input("Publisher/Brand").strip().title()
-        with col2:
-            quantity = st.number_input("Quantity in Stock", min_value=0, step=1)
-            price = st.number_input("Price (₹)", min_value=0.0, format="%.2f")
-            min_stock = st.number_input("Minimum Stock Level", min_value=0, step=1, value=5)
-        
-        submitted = st.form_submit_button("Add Item")
-        if submitted:
-            if name:
-                if name in st.session_state.stationery_inventory:
-                    st.session_state.stationery_inventory[name]["quantity"] += quantity
-                    st.success(f"Quantity updated for '{name}'!")
-                else:
-                    st.session_state.stationery_inventory[name] = {
-                        "category": category,
-                        "quantity": quantity,
-                        "publisher": publisher,
-                        "price": price,
-                        "min_stock": min_stock
-                    }
-                    st.success(f"'{name}' added successfully!")
-                
-                # Check stock balance after adding/updating
-                check_stock_balance(name)
-            else:
-                st.error("Please enter an item name")
-
-def view_inventory():
-    st.subheader("Stationery Inventory")
-    
-    if not st.session_state.stationery_inventory:
-        st.info("No items in stock.")
-    else:
-        # Convert to DataFrame for nice display
-        df = pd.DataFrame.from_dict(st.session_state.stationery_inventory, orient='index')
-        df.index.name = 'Name'
-        df.reset_index(inplace=True)
-        df = df[['Name', 'category', 'publisher', 'price', 'quantity', 'min_stock']]
-        
-        # Add stock status column
-        df['Status'] = df.apply(
-            lambda row: "🟢 Adequate" if row['quantity'] >= row['min_stock'] else "🔴 Low Stock", 
-            axis=1
-        )
-        
-        df.columns = ['Name', 'Category', 'Brand', 'Price (₹)', 'Quantity', 'Min Stock', 'Status']
-        
-        # Add filtering options
-        st.sidebar.subheader("Filter Inventory")
-        filter_category = st.sidebar.selectbox(
-            "Filter by Category", 
-            ["All"] + sorted(list(df['Category'].unique()))
-        )
-        filter_status = st.sidebar.selectbox(
-            "Filter by Stock Status", 
-            ["All", "Adequate", "Low Stock"]
-        )
-        
-        # Apply filters
-        if filter_category != "All":
-            df = df[df['Category'] == filter_category]
-        if filter_status != "All":
-            status_filter = filter_status == "Adequate"
-            df = df[df['Status'].str.contains("🟢" if status_filter else "🔴")]
-        
-        st.dataframe(
-            df.style.apply(
-                lambda x: ['background-color: #ffcccc' if x['Status'] == '🔴 Low Stock' else '' for i, x in df.iterrows()], 
-                axis=1
-            ),
-            hide_index=True,
-            use_container_width=True
-        )
-        
-        # Show statistics
-        total_items = len(df)
-        total_quantity = df['Quantity'].sum()
-        total_value = (df['Price (₹)'] * df['Quantity']).sum()
-        low_stock_items = len(df[df['Status'] == '🔴 Low Stock'])
-        
-        st.subheader("Inventory Summary")
-        col1, col2, col3, col4 = st.columns(4)
-        col1.metric("Total Items", total_items)
-        col2.metric("Total Quantity", total_quantity)
-        col3.metric("Total Value", f"₹{total_value:,.2f}")
-        col4.metric("Low Stock Items", low_stock_items, delta_color="inverse")
-
-def check_stock_balance(item_name=None):
-    """Check and alert for low stock items"""
-    if not st.session_state.stationery_inventory:
-        return
-    
-    low_stock_items = []
-    
-    if item_name:  # Check single item
-        item = st.session_state.stationery_inventory[item_name]
-        if item['quantity'] < item['min_stock']:
-            st.warning(f"⚠️ Low stock alert for {item_name}! Current: {item['quantity']}, Minimum: {item['min_stock']}")
-    else:  # Check all items
-        for name, details in st.session_state.stationery_inventory.items():
-            if details['quantity'] < details['min_stock']:
-                low_stock_items.append(name)
-        
-        if low_stock_items:
-            with st.sidebar:
-                st.error("⚠️ Low Stock Alert!")
-                for item in low_stock_items:
-                    st.write(f"- {item}")
-
-def search_item():
-    st.subheader("Search Item")
-    search_term = st.text_input("Enter item name to search").strip().title()
-    
-    if search_term:
-        if search_term in st.session_state.stationery_inventory:
-            item = st.session_state.stationery_inventory[search_term]
-            st.success("Item found!")
-            
-            col1, col2 = st.columns(2)
-            with col1:
-                st.markdown(f"**Name:** {search_term}")
-                st.markdown(f"**Category:** {item['category']}")
-                st.markdown(f"**Brand:** {item['publisher']}")
-            with col2:
-                st.markdown(f"**Price:** ₹{item['price']:.2f}")
-                st.markdown(f"**Quantity in Stock:** {item['quantity']}")
-                st.markdown(f"**Minimum Stock Level:** {item['min_stock']}")
-            
-            # Show stock status
-            if item['quantity'] < item['min_stock']:
-                st.error(f"⚠️ Low stock! Current: {item['quantity']}, Minimum: {item['min_stock']}")
-            else:
-                st.success(f"Stock level adequate ({item['quantity']})")
-        else:
-            st.error("Item not found!")
-
-def update_item():
-    st.subheader("Update Item")
-    item_names = list(st.session_state.stationery_inventory.keys())
-    
-    if not item_names:
-        st.warning("No items in inventory to update")
-        return
-    
-    selected_item = st.selectbox("Select item to update", item_names)
-    
-    if selected_item:
-        item = st.session_state.stationery_inventory[selected_item]
-        
-        with st.form("update_form"):
-            st.markdown(f"**Current Details for {selected_item}**")
-            
-            col1, col2 = st.columns(2)
-            with col1:
-                new_name = st.text_input("Name", value=selected_item).strip().title()
-                new_category = st.selectbox(
-                    "Category", 
-                    CATEGORIES, 
-                    index=CATEGORIES.index(item['category'])
-                )
-                new_publisher = st.text_input("Publisher/Brand", value=item['publisher'])
-            with col2:
-                new_price = st.number_input(
-                    "Price (₹)", 
-                    value=float(item['price']), 
-                    min_value=0.0, 
-                    format="%.2f"
-                )
-                new_quantity = st.number_input(
-                    "Quantity", 
-                    value=item['quantity'], 
-                    min_value=0, 
-                    step=1
-                )
-                new_min_stock = st.number_input(
-                    "Minimum Stock Level", 
-                    value=item['min_stock'], 
-                    min_value=0, 
-                    step=1
-                )
-            
-            submitted = st.form_submit_button("Update Item")
-            if submitted:
-                # Handle name change
-                if new_name != selected_item:
-                    st.session_state.stationery_inventory[new_name] = st.session_state.stationery_inventory.pop(selected_item)
-                    selected_item = new_name
-                
-                # Update all fields
-                st.session_state.stationery_inventory[selected_item] = {
-                    "category": new_category,
-                    "publisher": new_publisher,
-                    "price": new_price,
-                    "quantity": new_quantity,
-                    "min_stock": new_min_stock
-                }
-                st.success(f"'{selected_item}' updated successfully!")
-                
-                # Check stock balance after update
-                check_stock_balance(selected_item)
-
-def main():
-    st.set_page_config(
-        page_title="Stationery Shop Inventory", 
-        page_icon="📚", 
-        layout="wide",
-        initial_sidebar_state="expanded"
-    )
-    st.title("📚 Stationery Shop Inventory System")
-    
-    menu_options = {
-        "Add New Item": add_item,
-        "View Inventory": view_inventory,
-        "Search Item": search_item,
-        "Update Item": update_item
-    }
-    
-    # Sidebar navigation
-    with st.sidebar:
-        st.header("Navigation")
-        selected_option = st.radio("Select an option", list(menu_options.keys()))
-        
-        st.divider()
-        st.header("Inventory Summary")
-        if st.session_state.stationery_inventory:
-            total_items = len(st.session_state.stationery_inventory)
-            total_qty = sum(item['quantity'] for item in st.session_state.stationery_inventory.values())
-            total_value = sum(item['price'] * item['quantity'] for item in st.session_state.stationery_inventory.values())
-            
-            st.markdown(f"**Total Items:** {total_items}")
-            st.markdown(f"**Total Quantity:** {total_qty}")
-            st.markdown(f"**Total Value:** ₹{total_value:,.2f}")
-            
-            # Check stock balance for all items
-            check_stock_balance()
-        else:
-            st.info("No items in inventory")
-    
-    # Display the selected page
-    menu_options[selected_option]()
-
-if __name__ == "__main__":
+import functools
+import uuid
+
+import streamlit as st
+import pandas as pd
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; numpy reductions remain the fallback
+    njit = None
+
+@functools.lru_cache(maxsize=1024)
+def _norm(s):
+    """Normalize a user-entered name; memoized since names repeat often."""
+    return s.strip().title()
+
+# Inventory columns carry their display names so the view never renames.
+# float32/int32 are plenty for shop prices and counts and halve the bytes
+# scanned by the summary reductions and filters.
+INVENTORY_COLUMNS = ['Category', 'Brand', 'Price (₹)', 'Quantity', 'Min Stock']
+INVENTORY_DTYPES = {'Price (₹)': 'float32', 'Quantity': 'int32', 'Min Stock': 'int32'}
+
+# Initialize session state for inventory if it doesn't exist.
+# Stored as a Name-indexed DataFrame (one typed column per attribute) so
+# view_inventory can display it without rebuilding from a dict on every rerun.
+if 'stationery_inventory' not in st.session_state:
+    inventory = pd.DataFrame(columns=INVENTORY_COLUMNS).astype(INVENTORY_DTYPES)
+    inventory.index.name = 'Name'
+    st.session_state.stationery_inventory = inventory
+
+# Version counter bumped on every mutation; keys the cached view below.
+# The token makes cache keys session-unique: st.cache_data/cache_resource
+# are shared across sessions, but these helpers read per-session state.
+if 'inv_version' not in st.session_state:
+    st.session_state.inv_version = 0
+if 'session_token' not in st.session_state:
+    st.session_state.session_token = uuid.uuid4().hex
+
+# Names currently below minimum stock, maintained incrementally on mutation
+# so the sidebar alert doesn't rescan the whole inventory every rerun
+if 'low_stock_set' not in st.session_state:
+    inv = st.session_state.stationery_inventory
+    st.session_state.low_stock_set = set(inv.index[inv['Quantity'] < inv['Min Stock']])
+
+# Predefined categories
+CATEGORIES = [
+    "Writing Instruments",
+    "Paper Products",
+    "Correction Tools",
+    "Geometry Tools",
+    "Files & Folders",
+    "Office Supplies",
+    "Art & Craft",
+    "School Essentials"
+]
+
+# Sidebar filter options, built once at import instead of per rerun
+CATEGORY_FILTER_OPTIONS = ["All"] + CATEGORIES
+
+def bulk_add(rows):
+    """Merge a batch of rows into the inventory with vectorized operations.
+
+    Expects columns Name, Category, Brand, Price, Quantity, MinStock.
+    Names are normalized with vectorized string ops, then duplicates get
+    a single masked quantity increment and new rows one concat — no
+    per-row Python loop. Returns (updated_count, added_count), or None
+    after reporting an error if the batch fails validation.
+    """
+    inv = st.session_state.stationery_inventory
+
+    required = ['Name', 'Category', 'Brand', 'Price', 'Quantity', 'MinStock']
+    missing = [column for column in required if column not in rows.columns]
+    if missing:
+        st.error(f"CSV is missing required columns: {', '.join(missing)}")
+        return None
+
+    rows = rows.copy()
+    rows['Name'] = rows['Name'].astype(str).str.strip().str.title()
+    rows = rows.drop_duplicates(subset='Name', keep='last').set_index('Name')
+    rows = rows[['Category', 'Brand', 'Price', 'Quantity', 'MinStock']]
+
+    unknown = ~rows['Category'].isin(CATEGORIES)
+    if unknown.any():
+        bad = ', '.join(sorted(rows['Category'][unknown].astype(str).unique()))
+        st.error(f"Unknown categories: {bad}")
+        return None
+
+    for column in ('Price', 'Quantity', 'MinStock'):
+        rows[column] = pd.to_numeric(rows[column], errors='coerce')
+    invalid = rows[['Price', 'Quantity', 'MinStock']].isna().any(axis=1)
+    if invalid.any():
+        bad = ', '.join(rows.index[invalid])
+        st.error(f"Rows with missing or non-numeric values: {bad}")
+        return None
+
+    rows.columns = INVENTORY_COLUMNS
+    rows = rows.astype(INVENTORY_DTYPES)
+
+    dup = rows.index.isin(inv.index)
+    dup_names = rows.index[dup]
+    if len(dup_names):
+        inv.loc[dup_names, 'Quantity'] += rows.loc[dup_names, 'Quantity'].to_numpy()
+
+    new_rows = rows[~dup]
+    if not new_rows.empty:
+        inv = pd.concat([inv, new_rows])
+        st.session_state.stationery_inventory = inv
+
+    # Refresh low-stock tracking for the touched names in one pass
+    touched = rows.index
+    low = inv.loc[touched, 'Quantity'].to_numpy() < inv.loc[touched, 'Min Stock'].to_numpy()
+    low_set = st.session_state.low_stock_set
+    low_set.difference_update(touched)
+    low_set.update(touched[low])
+    st.session_state.inv_version += 1
+
+    return len(dup_names), len(new_rows)
+
+def add_item():
+    st.subheader("Add New Stationery Item")
+    with st.form("add_form"):
+        col1, col2 = st.columns(2)
+        with col1:
+            name = _norm(st.text_input("Item Name"))
+            category = st.selectbox("Category", CATEGORIES)
+            publisher = _norm(st.text_input("Publisher/Brand"))
+        with col2:
+            quantity = st.number_input("Quantity in Stock", min_value=0, step=1)
+            price = st.number_input("Price (₹)", min_value=0.0, format="%.2f")
+            min_stock = st.number_input("Minimum Stock Level", min_value=0, step=1, value=5)
+        
+        submitted = st.form_submit_button("Add Item")
+        if submitted:
+            if name:
+                inv = st.session_state.stationery_inventory
+                low_set = st.session_state.low_stock_set
+                if name in inv.index:
+                    inv.at[name, 'Quantity'] += quantity
+                    st.success(f"Quantity updated for '{name}'!")
+                else:
+                    # Insert via a typed one-row frame: enlarging with .loc
+                    # would silently upcast the columns to float64/int64
+                    new_row = pd.DataFrame(
+                        [[category, publisher, price, quantity, min_stock]],
+                        columns=INVENTORY_COLUMNS,
+                        index=pd.Index([name], name='Name')
+                    ).astype(INVENTORY_DTYPES)
+                    inv = pd.concat([inv, new_row])
+                    st.session_state.stationery_inventory = inv
+                    st.success(f"'{name}' added successfully!")
+                if inv.at[name, 'Quantity'] < inv.at[name, 'Min Stock']:
+                    low_set.add(name)
+                else:
+                    low_set.discard(name)
+                st.session_state.inv_version += 1
+                
+                # Check stock balance after adding/updating
+                check_stock_balance(name)
+            else:
+                st.error("Please enter an item name")
+
+    with st.expander("Bulk Import from CSV"):
+        uploaded = st.file_uploader(
+            "CSV with Name, Category, Brand, Price, Quantity, MinStock columns",
+            type="csv"
+        )
+        if uploaded is not None and st.button("Import"):
+            result = bulk_add(pd.read_csv(uploaded))
+            if result is not None:
+                updated, added = result
+                st.success(f"Imported {added} new items, updated {updated} existing items")
+
+# Below this size the separate numpy reductions beat the JIT'd loop on
+# dispatch overhead; above it the fused single pass wins on bandwidth
+_NUMBA_THRESHOLD = 10_000
+
+if njit is not None:
+    @njit(cache=True)
+    def _fused_totals(qty, price):
+        total_qty = 0
+        total_value = 0.0
+        for i in range(qty.size):
+            total_qty += qty[i]
+            total_value += price[i] * qty[i]
+        return total_qty, total_value
+
+@st.cache_data
+def _inventory_totals(token, version):
+    """Item count, total quantity and stock value for the given inventory version."""
+    inv = st.session_state.stationery_inventory
+    qty = inv['Quantity'].to_numpy()
+    price = inv['Price (₹)'].to_numpy()
+    if njit is not None and qty.size >= _NUMBA_THRESHOLD:
+        total_qty, total_value = _fused_totals(qty, price)
+        return len(inv), int(total_qty), float(total_value)
+    return len(inv), int(qty.sum()), float(price @ qty)
+
+@st.cache_data
+def _build_view(token, version):
+    """Build the display DataFrame for the given inventory version.
+
+    Cached on the version counter so reruns that didn't mutate the
+    inventory get the previous result back instead of recomputing.
+    """
+    df = st.session_state.stationery_inventory.reset_index()
+
+    # Tiered stock status in one vectorized pass: first matching condition wins.
+    # The low mask includes qty == 0 so an out-of-stock item with min_stock 0
+    # is filtered, counted and highlighted consistently with its tier.
+    qty = df['Quantity'].to_numpy()
+    minimum = df['Min Stock'].to_numpy()
+    low = (qty == 0) | (qty < minimum)
+    df['Status'] = np.select(
+        [qty == 0, qty < minimum, qty < 2 * minimum],
+        ["⛔ Out of Stock", "🔴 Low Stock", "🟡 Watch"],
+        default="🟢 Adequate"
+    )
+    df['_low'] = low  # hidden boolean backing the Status column, used for filtering
+    return df
+
+@st.cache_resource
+def _styled_view(token, version, filter_category, filter_status):
+    """Filtered inventory, its low-stock mask and the styled table HTML.
+
+    Styler HTML generation walks every cell, so cache it per
+    (version, filters) combination; reruns that change neither get the
+    rendered table back for free.
+    """
+    df = _build_view(token, version)
+    low = df.pop('_low').to_numpy()
+
+    # Apply filters
+    if filter_category != "All":
+        keep = (df['Category'] == filter_category).to_numpy()
+        df = df[keep]
+        low = low[keep]
+    if filter_status != "All":
+        keep = ~low if filter_status == "Adequate" else low
+        df = df[keep]
+        low = low[keep]
+
+    # Highlight low-stock rows with one precomputed style array per column.
+    # format(escape="html") is required: names and brands are free-text user
+    # input and the HTML is rendered with unsafe_allow_html. precision=2
+    # keeps prices at two decimals instead of the Styler's precision-6
+    # default (which also exposes float32 noise like 55.369999). Trade-off of
+    # the HTML table vs. st.dataframe: no sortable grid or use_container_width.
+    row_styles = np.where(low, 'background-color: #ffcccc', '')
+    html = (
+        df.style
+        .format(escape="html", precision=2)
+        .apply(lambda col: row_styles, axis=0)
+        .hide(axis='index')
+        .to_html()
+    )
+    return df, low, html
+
+def view_inventory():
+    st.subheader("Stationery Inventory")
+
+    if st.session_state.stationery_inventory.empty:
+        st.info("No items in stock.")
+    else:
+        # Add filtering options
+        st.sidebar.subheader("Filter Inventory")
+        filter_category = st.sidebar.selectbox(
+            "Filter by Category",
+            CATEGORY_FILTER_OPTIONS
+        )
+        filter_status = st.sidebar.selectbox(
+            "Filter by Stock Status",
+            ["All", "Adequate", "Low Stock"]
+        )
+
+        df, low, html = _styled_view(
+            st.session_state.session_token, st.session_state.inv_version,
+            filter_category, filter_status
+        )
+        st.markdown(html, unsafe_allow_html=True)
+
+
+        # Show statistics (single dot-product reduction over the filtered columns)
+        total_items = len(df)
+        qty = df['Quantity'].to_numpy()
+        total_quantity = int(qty.sum())
+        total_value = float(df['Price (₹)'].to_numpy() @ qty)
+        low_stock_items = int(low.sum())
+        
+        st.subheader("Inventory Summary")
+        col1, col2, col3, col4 = st.columns(4)
+        col1.metric("Total Items", total_items)
+        col2.metric("Total Quantity", total_quantity)
+        col3.metric("Total Value", f"₹{total_value:,.2f}")
+        col4.metric("Low Stock Items", low_stock_items, delta_color="inverse")
+
+def check_stock_balance(item_name=None):
+    """Check and alert for low stock items"""
+    inv = st.session_state.stationery_inventory
+    if inv.empty:
+        return
+
+    if item_name:  # Check single item
+        quantity = inv.at[item_name, 'Quantity']
+        min_stock = inv.at[item_name, 'Min Stock']
+        if quantity < min_stock:
+            st.warning(f"⚠️ Low stock alert for {item_name}! Current: {quantity}, Minimum: {min_stock}")
+    else:  # Report low stock, re-sorting the set only when inventory changed
+        version = st.session_state.inv_version
+        if st.session_state.get('warned_at') != version:
+            st.session_state.cached_warnings = sorted(st.session_state.low_stock_set)
+            st.session_state.warned_at = version
+        low_stock_items = st.session_state.cached_warnings
+
+        if low_stock_items:
+            with st.sidebar:
+                st.error("⚠️ Low Stock Alert!")
+                for item in low_stock_items:
+                    st.write(f"- {item}")
+
+def search_item():
+    st.subheader("Search Item")
+    # Form so typing doesn't trigger a rerun per keystroke; only Search does
+    with st.form("search_form"):
+        search_term = _norm(st.text_input("Enter item name to search"))
+        submitted = st.form_submit_button("Search")
+
+    if submitted and search_term:
+        inv = st.session_state.stationery_inventory
+        if search_term in inv.index:
+            item = inv.loc[search_term]
+            st.success("Item found!")
+
+            col1, col2 = st.columns(2)
+            with col1:
+                st.markdown(f"**Name:** {search_term}")
+                st.markdown(f"**Category:** {item['Category']}")
+                st.markdown(f"**Brand:** {item['Brand']}")
+            with col2:
+                st.markdown(f"**Price:** ₹{item['Price (₹)']:.2f}")
+                st.markdown(f"**Quantity in Stock:** {item['Quantity']}")
+                st.markdown(f"**Minimum Stock Level:** {item['Min Stock']}")
+
+            # Show stock status
+            if item['Quantity'] < item['Min Stock']:
+                st.error(f"⚠️ Low stock! Current: {item['Quantity']}, Minimum: {item['Min Stock']}")
+            else:
+                st.success(f"Stock level adequate ({item['Quantity']})")
+        else:
+            st.error("Item not found!")
+
+def update_item():
+    st.subheader("Update Item")
+    inv = st.session_state.stationery_inventory
+
+    if inv.empty:
+        st.warning("No items in inventory to update")
+        return
+
+    # The index is already an iterable of names; no per-rerun list copy
+    selected_item = st.selectbox("Select item to update", inv.index)
+
+    if selected_item:
+        item = inv.loc[selected_item]
+        
+        with st.form("update_form"):
+            st.markdown(f"**Current Details for {selected_item}**")
+            
+            col1, col2 = st.columns(2)
+            with col1:
+                new_name = _norm(st.text_input("Name", value=selected_item))
+                new_category = st.selectbox(
+                    "Category",
+                    CATEGORIES,
+                    index=CATEGORIES.index(item['Category'])
+                )
+                new_publisher = st.text_input("Publisher/Brand", value=item['Brand'])
+            with col2:
+                new_price = st.number_input(
+                    "Price (₹)",
+                    value=float(item['Price (₹)']),
+                    min_value=0.0,
+                    format="%.2f"
+                )
+                new_quantity = st.number_input(
+                    "Quantity",
+                    value=int(item['Quantity']),
+                    min_value=0,
+                    step=1
+                )
+                new_min_stock = st.number_input(
+                    "Minimum Stock Level",
+                    value=int(item['Min Stock']),
+                    min_value=0,
+                    step=1
+                )
+
+            submitted = st.form_submit_button("Update Item")
+            if submitted:
+                # Handle name change; renaming onto an existing item would
+                # duplicate the index, so reject it instead
+                low_set = st.session_state.low_stock_set
+
+                if new_name != selected_item:
+                    if new_name in inv.index:
+                        st.error(f"An item named '{new_name}' already exists")
+                        return
+                    inv.rename(index={selected_item: new_name}, inplace=True)
+                    low_set.discard(selected_item)
+                    selected_item = new_name
+
+                # Update all fields
+                inv.loc[selected_item] = [
+                    new_category, new_publisher, new_price, new_quantity, new_min_stock
+                ]
+                if new_quantity < new_min_stock:
+                    low_set.add(selected_item)
+                else:
+                    low_set.discard(selected_item)
+                st.session_state.inv_version += 1
+                st.success(f"'{selected_item}' updated successfully!")
+                
+                # Check stock balance after update
+                check_stock_balance(selected_item)
+
+def main():
+    st.set_page_config(
+        page_title="Stationery Shop Inventory", 
+        page_icon="📚", 
+        layout="wide",
+        initial_sidebar_state="expanded"
+    )
+    st.title("📚 Stationery Shop Inventory System")
+    
+    menu_options = {
+        "Add New Item": add_item,
+        "View Inventory": view_inventory,
+        "Search Item": search_item,
+        "Update Item": update_item
+    }
+    
+    # Sidebar navigation
+    with st.sidebar:
+        st.header("Navigation")
+        selected_option = st.radio("Select an option", list(menu_options.keys()))
+        
+        st.divider()
+        # Collapsed by default to keep the sidebar compact. Streamlit still
+        # executes this block on every rerun; cheapness comes from the cached
+        # totals and warning list, not from the expander being closed.
+        with st.expander("Inventory Summary", expanded=False):
+            inv = st.session_state.stationery_inventory
+            if not inv.empty:
+                total_items, total_qty, total_value = _inventory_totals(
+                    st.session_state.session_token, st.session_state.inv_version
+                )
+
+                st.markdown(f"**Total Items:** {total_items}")
+                st.markdown(f"**Total Quantity:** {total_qty}")
+                st.markdown(f"**Total Value:** ₹{total_value:,.2f}")
+
+                # Check stock balance for all items
+                check_stock_balance()
+            else:
+                st.info("No items in inventory")
+    
+    # Display the selected page
+    menu_options[selected_option]()
+
+if __name__ == "__main__":
     main()
\ No newline at end of file